@@ -1035,6 +1035,114 @@ expected_log="01. [09:15 => 09:45] Work: 0h:30m (0h:30m)"
 actual_log=$($WT_CMD log)
 check_output "mod start add adjusts first cycle later" "$expected_log" "$actual_log"
 
+###############################################################################
+# Test 28: Daily report survives reset
+###############################################################################
+print_test "28" "Daily report survives reset"
+setup_test
+
+mock_time "2026-01-20 09:00"
+run_wt new
+
+run_wt start
+mock_time "2026-01-20 10:00"
+run_wt stop
+
+mock_time "2026-01-21 08:00"
+run_wt new
+
+run_wt start
+mock_time "2026-01-21 08:30"
+run_wt stop
+
+mock_time "2026-01-21 09:00"
+run_wt new
+
+expected_daily="2026-01-21 | 08:00 -> 08:30 | Work: 0h:30m | Break: 0h:00m | Paused: 0h:00m | Total: 0h:30m
+2026-01-20 | 09:00 -> 10:00 | Work: 1h:00m | Break: 0h:00m | Paused: 0h:00m | Total: 1h:00m"
+actual_daily=$(cat "$WT_ROOT/.out/daily-reports")
+check_output "daily report keeps earlier days across resets" "$expected_daily" "$actual_daily"
+
+###############################################################################
+# Test 29: Daily report survives reset with a relative WT_REPORT_FILE
+###############################################################################
+print_test "29" "Daily report survives reset with a relative WT_REPORT_FILE"
+setup_test
+
+# Run from $WT_ROOT so the relative path points into the output folder
+wt_abs="$(cd "$(dirname "$WT_CMD")" && pwd)/$(basename "$WT_CMD")"
+run_wt_in_root() {
+    (cd "$WT_ROOT" && WT_REPORT_FILE=.out/daily-reports "$wt_abs" "$@") > /dev/null 2>&1
+}
+
+mock_time "2026-01-20 09:00"
+run_wt_in_root new
+
+run_wt_in_root start
+mock_time "2026-01-20 10:00"
+run_wt_in_root stop
+
+mock_time "2026-01-21 08:00"
+run_wt_in_root new
+
+run_wt_in_root start
+mock_time "2026-01-21 08:30"
+run_wt_in_root stop
+
+mock_time "2026-01-21 09:00"
+run_wt_in_root new
+
+expected_daily="2026-01-21 | 08:00 -> 08:30 | Work: 0h:30m | Break: 0h:00m | Paused: 0h:00m | Total: 0h:30m
+2026-01-20 | 09:00 -> 10:00 | Work: 1h:00m | Break: 0h:00m | Paused: 0h:00m | Total: 1h:00m"
+actual_daily=$(cat "$WT_ROOT/.out/daily-reports")
+check_output "relative daily report keeps earlier days across resets" "$expected_daily" "$actual_daily"
+
+###############################################################################
+# Test 30: Daily report marks a day crossing midnight
+###############################################################################
+print_test "30" "Daily report marks a day crossing midnight"
+setup_test
+
+mock_time "2026-01-20 23:00"
+run_wt new
+
+run_wt start
+mock_time "2026-01-21 01:30"
+run_wt stop
+
+mock_time "2026-01-21 01:45"
+run_wt new
+
+# Counted in calendar days, like `wt report`, not in elapsed 24h periods
+expected_daily="2026-01-20 | 23:00 -> 01:30 | Work: 2h:30m | Break: 0h:00m | Paused: 0h:00m | Total: 2h:30m [+1 day]"
+actual_daily=$(cat "$WT_ROOT/.out/daily-reports")
+check_output "daily report line carries the day indicator" "$expected_daily" "$actual_daily"
+
+###############################################################################
+# Test 31: Reset restores a daily report left parked by an interrupted reset
+###############################################################################
+print_test "31" "Reset restores a daily report left parked by an interrupted reset"
+setup_test
+echo "2026-01-20 | 09:00 -> 10:00 | Work: 1h:00m | Break: 0h:00m | Paused: 0h:00m | Total: 1h:00m" > "$WT_ROOT/.out-daily-reports"
+
+mock_time "2026-01-21 08:00"
+run_wt new
+
+run_wt start
+mock_time "2026-01-21 08:30"
+run_wt stop
+
+mock_time "2026-01-21 09:00"
+run_wt new
+
+expected_daily="2026-01-21 | 08:00 -> 08:30 | Work: 0h:30m | Break: 0h:00m | Paused: 0h:00m | Total: 0h:30m
+2026-01-20 | 09:00 -> 10:00 | Work: 1h:00m | Break: 0h:00m | Paused: 0h:00m | Total: 1h:00m"
+actual_daily=$(cat "$WT_ROOT/.out/daily-reports")
+check_output "parked report is merged back below newer days" "$expected_daily" "$actual_daily"
+
+actual_parked=$([ -e "$WT_ROOT/.out-daily-reports" ] && echo "present" || echo "gone")
+check_output "parked report is removed" "gone" "$actual_parked"
+
 echo ""
 echo "=========================================="
 echo "Test Results"
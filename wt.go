@@ -1,13 +1,18 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/urfave/cli/v3"
@@ -20,6 +25,7 @@ const (
 	DebugLogName     = "debug-log"
 	DailyReportName  = "daily-reports"
 	DT_FORMAT        = "2006-01-02 15:04"
+	DATE_ONLY_FORMAT = "2006-01-02"
 	TIME_ONLY_FORMAT = "15:04"
 )
 
@@ -30,6 +36,13 @@ const (
 	StatusRunning = "running"
 )
 
+// errNoTimer is returned by load() when there is no saved timer
+var errNoTimer = errors.New("No timer exists.")
+
+// errAborted is returned when the user declines a confirmation prompt. main
+// exits quietly with status 0 on it.
+var errAborted = errors.New("Aborted.")
+
 // Mode enum
 const (
 	ModeSilent  = "silent"
@@ -66,50 +79,108 @@ type Timer struct {
 	Mode            string          `json:"mode"`              // Output verbosity: "silent", "normal", or "verbose"
 	Timeline        []TimelineEntry `json:"timeline"`          // Completed work and break cycles
 	DayStart        string          `json:"day_start"`         // When the work day started (all timestamps computed from this)
+
+	dayStart   cachedTime // Parsed DayStart, see DayStartTime()
+	pauseStart cachedTime // Parsed PauseStartStr, see PauseStartTime()
+	stop       cachedTime // Parsed StopDatetimeStr, see StopTime()
+
+	stored []byte // File contents as last loaded or saved, lets save() skip no-op writes
 }
 
-// UnmarshalJSON implements custom unmarshaling for backward compatibility
-func (t *Timer) UnmarshalJSON(data []byte) error {
-	type Alias Timer
-	aux := &struct {
-		AccumulatedMinutes *int `json:"accumulated_minutes,omitempty"`
-		*Alias
-	}{
-		Alias: (*Alias)(t),
-	}
+// cachedTime keeps a parsed datetime string and re-parses only when the
+// string it was parsed from changes
+type cachedTime struct {
+	src string
+	t   time.Time
+}
 
-	if err := json.Unmarshal(data, &aux); err != nil {
-		return err
+func (c *cachedTime) get(s string) time.Time {
+	if s != c.src {
+		c.t, _ = parseTime(s)
+		c.src = s
 	}
+	return c.t
+}
 
-	// Backward compatibility: use accumulated_minutes if paused_minutes not present
-	if aux.AccumulatedMinutes != nil && t.PausedMinutes == 0 {
-		t.PausedMinutes = *aux.AccumulatedMinutes
-	}
+// timerFile is the on-disk form of Timer. It embeds the timer so the file
+// decodes in a single pass, and carries fields from older versions.
+type timerFile struct {
+	AccumulatedMinutes *int `json:"accumulated_minutes,omitempty"` // Pre-rename name of paused_minutes
+	*Timer
+}
 
-	return nil
+// DayStartTime returns DayStart as a time.Time. The parsed value is kept
+// on the timer and only re-parsed when DayStart has changed.
+func (t *Timer) DayStartTime() time.Time {
+	return t.dayStart.get(t.DayStart)
+}
+
+// PauseStartTime returns PauseStartStr as a time.Time, cached like DayStartTime
+func (t *Timer) PauseStartTime() time.Time {
+	return t.pauseStart.get(t.PauseStartStr)
+}
+
+// StopTime returns StopDatetimeStr as a time.Time, cached like DayStartTime
+func (t *Timer) StopTime() time.Time {
+	return t.stop.get(t.StopDatetimeStr)
 }
 
 // CurrentCycleStart returns the start time of the current (or next) cycle
 // by calculating DayStart + sum of all timeline entry durations.
 // This is the single source of truth for cycle start times.
 func (t *Timer) CurrentCycleStart() time.Time {
-	start, _ := parseTime(t.DayStart)
+	elapsed := 0
+	for _, entry := range t.Timeline {
+		elapsed += entry.Duration()
+	}
+	return t.DayStartTime().Add(time.Duration(elapsed) * time.Minute)
+}
+
+// TimelineTotals holds minute sums over the completed timeline
+type TimelineTotals struct {
+	Work    int // Work minutes (excludes paused time)
+	Break   int // Break minutes
+	Paused  int // Paused minutes within work entries
+	Elapsed int // Clock time covered by the timeline (sum of entry durations)
+}
+
+// Totals sums the timeline in a single pass. DayStart + Elapsed is the
+// same instant CurrentCycleStart() returns.
+func (t *Timer) Totals() TimelineTotals {
+	var totals TimelineTotals
 	for _, entry := range t.Timeline {
-		start = start.Add(time.Duration(entry.Duration()) * time.Minute)
+		if entry.Type == "work" {
+			totals.Work += entry.Minutes
+			totals.Paused += entry.PausedMinutes
+		} else {
+			totals.Break += entry.Minutes
+		}
+		totals.Elapsed += entry.Duration()
 	}
-	return start
+	return totals
+}
+
+// LastEntry returns the most recent timeline entry, or nil if the timeline is empty
+func (t *Timer) LastEntry() *TimelineEntry {
+	if len(t.Timeline) == 0 {
+		return nil
+	}
+	return &t.Timeline[len(t.Timeline)-1]
+}
+
+// IsActive reports whether a cycle is in progress (running or paused)
+func (t *Timer) IsActive() bool {
+	return t.Status == StatusRunning || t.Status == StatusPaused
 }
 
-// CompletedMinutes returns total work minutes from timeline
-func (t *Timer) CompletedMinutes() int {
-	total := 0
+// HasWorkCycles reports whether the timeline contains a completed work cycle
+func (t *Timer) HasWorkCycles() bool {
 	for _, entry := range t.Timeline {
 		if entry.Type == "work" {
-			total += entry.Minutes
+			return true
 		}
 	}
-	return total
+	return false
 }
 
 func main() {
@@ -131,73 +202,41 @@ func main() {
 				Usage:       "Starts a new timer or continues paused timer",
 				ArgsUsage:   "[time]",
 				Description: "Optionally provide time in HHMM format to backdate start (first cycle) or reduce previous break (subsequent cycles)",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
-					startTime := ""
-					if cmd.Args().Len() > 0 {
-						startTime = cmd.Args().Get(0)
-					}
-					return startCmd(timer, startTime)
-				},
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
+					return startCmd(timer, args.First())
+				}),
 			},
 			{
 				Name:  "stop",
 				Usage: "Stops running or paused timer",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
 					return stopCmd(timer)
-				},
+				}),
 			},
 			{
 				Name:        "pause",
 				Usage:       "Pauses currently running timer",
 				ArgsUsage:   "[time]",
 				Description: "Optionally provide time in HHMM format to add pause time",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
-					pauseTime := ""
-					if cmd.Args().Len() > 0 {
-						pauseTime = cmd.Args().Get(0)
-					}
-					return pauseCmd(timer, pauseTime)
-				},
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
+					return pauseCmd(timer, args.First())
+				}),
 			},
 			{
 				Name:  "check",
 				Usage: "Prints current and total time along with status",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
 					return checkCmd(timer)
-				},
+				}),
 			},
 			{
 				Name:        "log",
 				Usage:       "Show log of timer activity",
 				ArgsUsage:   "[type]",
 				Description: "Defaults to info log. Use 'debug' to see command execution timestamps",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
-					logType := ""
-					if cmd.Args().Len() > 0 {
-						logType = cmd.Args().Get(0)
-					}
-					return historyCmd(timer, logType)
-				},
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
+					return historyCmd(timer, args.First())
+				}),
 			},
 			{
 				Name:      "mod",
@@ -210,13 +249,8 @@ func main() {
      wt mod 3 add 15                  - Add 15min to cycle 3
      wt mod 5 pause add 10            - Add 10min paused time to cycle 5
      wt mod 2 drop                    - Remove cycle 2`,
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
-
-					args := cmd.Args().Slice()
+				Action: withTimer(func(timer *Timer, cmdArgs cli.Args) error {
+					args := cmdArgs.Slice()
 					if len(args) == 0 {
 						return modListCmd()
 					}
@@ -238,18 +272,14 @@ func main() {
 					}
 
 					return modListCmd()
-				},
+				}),
 			},
 			{
 				Name:  "next",
 				Usage: "Stop current timer and start next",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
 					return nextCmd(timer)
-				},
+				}),
 			},
 			{
 				Name:  "reset",
@@ -264,11 +294,7 @@ func main() {
 				ArgsUsage:   "[time]",
 				Description: "Optionally provide time in HHMM format to backdate start",
 				Action: func(ctx context.Context, cmd *cli.Command) error {
-					startTime := ""
-					if cmd.Args().Len() > 0 {
-						startTime = cmd.Args().Get(0)
-					}
-					return restartCmd(startTime)
+					return restartCmd(cmd.Args().First())
 				},
 			},
 			{
@@ -299,11 +325,11 @@ func main() {
 				Description: "Types: silent (only errors), normal (messages after actions), verbose (normal + auto check). If no type is provided, prints current mode.",
 				Action: func(ctx context.Context, cmd *cli.Command) error {
 					if cmd.Args().Len() == 0 {
-						timer, err := load()
+						header, err := loadHeader()
 						if err != nil {
 							return err
 						}
-						fmt.Println(timer.Mode)
+						fmt.Println(header.Mode)
 						return nil
 					}
 					return modeCmd(cmd.Args().Get(0))
@@ -313,13 +339,9 @@ func main() {
 				Name:        "report",
 				Usage:       "Print a one-line summary of the day's work",
 				Description: "Shows date, start time, end time, total work time, total break time, and total time",
-				Action: func(ctx context.Context, cmd *cli.Command) error {
-					timer, err := load()
-					if err != nil {
-						return err
-					}
+				Action: withTimer(func(timer *Timer, args cli.Args) error {
 					return reportCmd(timer)
-				},
+				}),
 			},
 			{
 				Name:  "debug",
@@ -339,6 +361,9 @@ func main() {
 	}
 
 	if err := app.Run(context.Background(), os.Args); err != nil {
+		if errors.Is(err, errAborted) {
+			return
+		}
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
@@ -346,81 +371,211 @@ func main() {
 
 // Helper functions
 
-func getCurrentTime() time.Time {
+// withTimer wraps a command that operates on the saved timer as a cli action,
+// loading the timer first
+func withTimer(fn func(timer *Timer, args cli.Args) error) func(context.Context, *cli.Command) error {
+	return func(ctx context.Context, cmd *cli.Command) error {
+		timer, err := load()
+		if err != nil {
+			return err
+		}
+		return fn(timer, cmd.Args())
+	}
+}
+
+// getCurrentTime returns the time of this invocation. It is read once so every
+// calculation within a command sees the same "now".
+var getCurrentTime = sync.OnceValue(func() time.Time {
 	mockTime := os.Getenv("WT_MOCK_TIME")
 	if mockTime != "" {
-		t, err := time.ParseInLocation(DT_FORMAT, mockTime, time.Local)
+		t, err := parseTime(mockTime)
 		if err == nil {
 			return t
 		}
 	}
 	return time.Now()
-}
+})
 
-// parseTime parses a datetime string in local timezone
+// parseTime parses a datetime string in local timezone.
+// DT_FORMAT is fixed-width, so well-formed input is read directly by position;
+// anything else goes through time.ParseInLocation to get the usual error.
 func parseTime(s string) (time.Time, error) {
+	if len(s) == len(DT_FORMAT) && s[4] == '-' && s[7] == '-' && s[10] == ' ' && s[13] == ':' {
+		year, ok1 := atoiFixed(s[0:4])
+		month, ok2 := atoiFixed(s[5:7])
+		day, ok3 := atoiFixed(s[8:10])
+		hour, ok4 := atoiFixed(s[11:13])
+		minute, ok5 := atoiFixed(s[14:16])
+		if ok1 && ok2 && ok3 && ok4 && ok5 &&
+			month >= 1 && month <= 12 && day >= 1 && day <= daysIn(time.Month(month), year) &&
+			hour < 24 && minute < 60 {
+			return time.Date(year, time.Month(month), day, hour, minute, 0, 0, time.Local), nil
+		}
+	}
 	return time.ParseInLocation(DT_FORMAT, s, time.Local)
 }
 
-func projectRootPath() (string, error) {
+// formatTime formats a time using DT_FORMAT
+func formatTime(t time.Time) string {
+	if year := t.Year(); year < 0 || year > 9999 {
+		return t.Format(DT_FORMAT)
+	}
+
+	b := make([]byte, 0, len(DT_FORMAT))
+	b = appendDate(b, t)
+	b = append(b, ' ')
+	b = appendClock(b, t)
+	return string(b)
+}
+
+// formatDate formats a time using DATE_ONLY_FORMAT
+func formatDate(t time.Time) string {
+	if year := t.Year(); year < 0 || year > 9999 {
+		return t.Format(DATE_ONLY_FORMAT)
+	}
+	return string(appendDate(make([]byte, 0, len(DATE_ONLY_FORMAT)), t))
+}
+
+// formatClock formats a time using TIME_ONLY_FORMAT
+func formatClock(t time.Time) string {
+	return string(appendClock(make([]byte, 0, len(TIME_ONLY_FORMAT)), t))
+}
+
+// appendDate appends t as YYYY-MM-DD; the year must be within 0-9999
+func appendDate(b []byte, t time.Time) []byte {
+	year, month, day := t.Date()
+	b = appendDigits(b, year, 4)
+	b = append(b, '-')
+	b = appendDigits(b, int(month), 2)
+	b = append(b, '-')
+	return appendDigits(b, day, 2)
+}
+
+// appendClock appends t as HH:MM
+func appendClock(b []byte, t time.Time) []byte {
+	hour, minute, _ := t.Clock()
+	b = appendDigits(b, hour, 2)
+	b = append(b, ':')
+	return appendDigits(b, minute, 2)
+}
+
+// atoiFixed parses a string consisting only of ASCII digits
+func atoiFixed(s string) (int, bool) {
+	n := 0
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c < '0' || c > '9' {
+			return 0, false
+		}
+		n = n*10 + int(c-'0')
+	}
+	return n, true
+}
+
+// appendDigits appends n zero-padded to width digits
+func appendDigits(b []byte, n, width int) []byte {
+	start := len(b)
+	for i := 0; i < width; i++ {
+		b = append(b, '0')
+	}
+	for i := len(b) - 1; i >= start && n > 0; i-- {
+		b[i] = byte('0' + n%10)
+		n /= 10
+	}
+	return b
+}
+
+// daysIn returns the number of days in the given month
+func daysIn(month time.Month, year int) int {
+	switch month {
+	case time.February:
+		if year%4 == 0 && (year%100 != 0 || year%400 == 0) {
+			return 29
+		}
+		return 28
+	case time.April, time.June, time.September, time.November:
+		return 30
+	}
+	return 31
+}
+
+// projectRootPath returns $WT_ROOT. The environment is only read once per run.
+var projectRootPath = sync.OnceValues(func() (string, error) {
 	root := os.Getenv("WT_ROOT")
 	if root == "" {
 		return "", fmt.Errorf("Env $WT_ROOT not set.")
 	}
 	return root, nil
-}
+})
 
-func outputFilePath() (string, error) {
+// The paths below are derived from $WT_ROOT and resolved once on first use
+
+var outputFolderPath = sync.OnceValues(func() (string, error) {
 	root, err := projectRootPath()
 	if err != nil {
 		return "", err
 	}
-	return filepath.Join(root, OutputFolder, OutputFileName), nil
-}
+	return filepath.Join(root, OutputFolder), nil
+})
 
-func debugLogFilePath() (string, error) {
-	root, err := projectRootPath()
+var outputFilePath = sync.OnceValues(func() (string, error) {
+	folder, err := outputFolderPath()
 	if err != nil {
 		return "", err
 	}
-	return filepath.Join(root, OutputFolder, DebugLogName), nil
-}
+	return filepath.Join(folder, OutputFileName), nil
+})
 
-func dailyReportFilePath() (string, error) {
+var debugLogFilePath = sync.OnceValues(func() (string, error) {
+	folder, err := outputFolderPath()
+	if err != nil {
+		return "", err
+	}
+	return filepath.Join(folder, DebugLogName), nil
+})
+
+var dailyReportFilePath = sync.OnceValues(func() (string, error) {
 	// Prefer WT_REPORT_FILE if set
 	if reportFile := os.Getenv("WT_REPORT_FILE"); reportFile != "" {
 		return reportFile, nil
 	}
 
-	root, err := projectRootPath()
+	folder, err := outputFolderPath()
 	if err != nil {
 		return "", err
 	}
-	return filepath.Join(root, OutputFolder, DailyReportName), nil
-}
-
-func outputFolderPath() (string, error) {
-	root, err := projectRootPath()
-	if err != nil {
-		return "", err
-	}
-	return filepath.Join(root, OutputFolder), nil
-}
+	return filepath.Join(folder, DailyReportName), nil
+})
 
 func deltaMinutes(start, end time.Time) int {
 	return int(end.Sub(start).Minutes())
 }
 
+// hourMinuteStrFromMinutes formats minutes as "1h 05m" (check output)
 func hourMinuteStrFromMinutes(minutes int) string {
-	h := minutes / 60
-	m := minutes % 60
-	return fmt.Sprintf("%dh %02dm", h, m)
+	return formatHourMinute(minutes, ' ')
 }
 
+// minutesToHourMinuteStr formats minutes as "1h:05m" (log, report and messages)
 func minutesToHourMinuteStr(mins int) string {
+	return formatHourMinute(mins, ':')
+}
+
+// formatHourMinute formats minutes as hours and zero-padded minutes joined by
+// sep, matching fmt's "%dh<sep>%02dm"
+func formatHourMinute(mins int, sep byte) string {
 	h := mins / 60
 	m := mins % 60
-	return fmt.Sprintf("%dh:%02dm", h, m)
+
+	b := make([]byte, 0, 12)
+	b = strconv.AppendInt(b, int64(h), 10)
+	b = append(b, 'h', sep)
+	if m >= 0 && m < 10 {
+		b = append(b, '0')
+	}
+	b = strconv.AppendInt(b, int64(m), 10)
+	b = append(b, 'm')
+	return string(b)
 }
 
 func stringTimeToMinutes(timeStr string) (int, error) {
@@ -428,72 +583,72 @@ func stringTimeToMinutes(timeStr string) (int, error) {
 		return 0, fmt.Errorf("Invalid time format. Should be digits only.")
 	}
 
-	var hour, minute int
-	switch len(timeStr) {
-	case 4:
-		h, _ := strconv.Atoi(timeStr[:2])
-		m, _ := strconv.Atoi(timeStr[2:])
-		hour, minute = h, m
-	case 3:
-		h, _ := strconv.Atoi(timeStr[:1])
-		m, _ := strconv.Atoi(timeStr[1:])
-		hour, minute = h, m
-	case 2, 1:
-		m, _ := strconv.Atoi(timeStr)
-		minute = m
-	default:
+	if len(timeStr) < 1 || len(timeStr) > 4 {
 		return 0, fmt.Errorf("Incorrect time format. Should be 1-4 digit HHMM.")
 	}
 
-	return hour*60 + minute, nil
+	// HHMM: the last two digits are minutes, anything above them is hours
+	n, _ := strconv.Atoi(timeStr)
+	return n/100*60 + n%100, nil
 }
 
 func validateTimeString(timeStr string) error {
-	if len(timeStr) < 1 || len(timeStr) > 4 || !isDigits(timeStr) {
-		return fmt.Errorf("Incorrect time format. Should be 1-4 digit HHMM.")
+	_, err := parseTimeString(timeStr)
+	return err
+}
+
+// parseTimeString validates a 1-4 digit HHMM string and converts it to minutes
+// in the same pass.
+func parseTimeString(timeStr string) (int, error) {
+	if len(timeStr) < 1 || len(timeStr) > 4 {
+		return 0, fmt.Errorf("Incorrect time format. Should be 1-4 digit HHMM.")
 	}
 
-	if len(timeStr) >= 2 {
-		minutes, _ := strconv.Atoi(timeStr[len(timeStr)-2:])
-		if minutes > 59 {
-			return fmt.Errorf("Incorrect time format. Minutes cannot exceed 59.")
+	value := 0
+	for i := 0; i < len(timeStr); i++ {
+		c := timeStr[i]
+		if c < '0' || c > '9' {
+			return 0, fmt.Errorf("Incorrect time format. Should be 1-4 digit HHMM.")
 		}
+		value = value*10 + int(c-'0')
 	}
 
-	return nil
+	if value%100 > 59 {
+		return 0, fmt.Errorf("Incorrect time format. Minutes cannot exceed 59.")
+	}
+
+	return value/100*60 + value%100, nil
 }
 
 func isDigits(s string) bool {
-	for _, c := range s {
-		if c < '0' || c > '9' {
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
 			return false
 		}
 	}
 	return true
 }
 
-func calculateCurrentMinutes(timer *Timer) int {
+// calculateCurrentMinutes returns work and paused minutes of the active cycle.
+// cycleStart must be timer.CurrentCycleStart(); callers that have walked the
+// timeline already pass their result to avoid walking it again.
+func calculateCurrentMinutes(timer *Timer, cycleStart time.Time) (workMinutes, pausedMinutes int) {
 	if timer.Status == StatusStopped {
-		return 0
+		return 0, 0
 	}
 
-	cycleStart := timer.CurrentCycleStart()
 	totalElapsed := deltaMinutes(cycleStart, getCurrentTime())
 
 	var totalPaused int
 	if timer.Status == StatusPaused {
-		pauseStart, _ := parseTime(timer.PauseStartStr)
+		pauseStart := timer.PauseStartTime()
 		currentPause := deltaMinutes(pauseStart, getCurrentTime())
 		totalPaused = timer.PausedMinutes + currentPause
 	} else {
 		totalPaused = timer.PausedMinutes
 	}
 
-	workMinutes := totalElapsed - totalPaused
-	if workMinutes < 0 {
-		return 0
-	}
-	return workMinutes
+	return max(totalElapsed-totalPaused, 0), totalPaused
 }
 
 func printMessageIfNotSilent(timer *Timer, message string) {
@@ -527,10 +682,9 @@ func save(timer *Timer) error {
 		return err
 	}
 
-	if _, err := os.Stat(folderPath); os.IsNotExist(err) {
-		if err := os.MkdirAll(folderPath, 0755); err != nil {
-			return err
-		}
+	// MkdirAll is a no-op when the folder already exists
+	if err := os.MkdirAll(folderPath, 0755); err != nil {
+		return err
 	}
 
 	filePath, err := outputFilePath()
@@ -538,12 +692,30 @@ func save(timer *Timer) error {
 		return err
 	}
 
-	data, err := json.MarshalIndent(timer, "", "    ")
+	// Compact: the state file is only read by wt (`wt debug` pretty-prints it)
+	data, err := json.Marshal(timer)
 	if err != nil {
 		return err
 	}
 
-	return os.WriteFile(filePath, data, 0644)
+	if bytes.Equal(data, timer.stored) {
+		return nil
+	}
+
+	// Write to a temp file and rename it over the state, so an interrupted
+	// write never leaves a truncated wt.json behind
+	tmpPath := filePath + ".tmp"
+	if err := os.WriteFile(tmpPath, data, 0644); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Rename(tmpPath, filePath); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+
+	timer.stored = data
+	return nil
 }
 
 func load() (*Timer, error) {
@@ -552,104 +724,136 @@ func load() (*Timer, error) {
 		return nil, err
 	}
 
-	if _, err := os.Stat(filePath); os.IsNotExist(err) {
-		return nil, fmt.Errorf("No timer exists.")
-	}
-
 	data, err := os.ReadFile(filePath)
-	if err != nil {
+	if os.IsNotExist(err) {
+		return nil, errNoTimer
+	} else if err != nil {
 		return nil, err
 	}
 
 	var timer Timer
-	if err := json.Unmarshal(data, &timer); err != nil {
+	aux := timerFile{Timer: &timer}
+	if err := json.Unmarshal(data, &aux); err != nil {
 		return nil, err
 	}
 
+	// Backward compatibility: use accumulated_minutes if paused_minutes not present
+	if aux.AccumulatedMinutes != nil && timer.PausedMinutes == 0 {
+		timer.PausedMinutes = *aux.AccumulatedMinutes
+	}
+
+	timer.stored = data
 	return &timer, nil
 }
 
-func logDebug(msg string) error {
-	filePath, err := debugLogFilePath()
+// timerHeader holds the scalar fields that are read on their own
+type timerHeader struct {
+	Status string `json:"status"`
+	Mode   string `json:"mode"`
+}
+
+// loadHeader reads the status and mode of the saved timer without decoding
+// the timeline
+func loadHeader() (*timerHeader, error) {
+	filePath, err := outputFilePath()
 	if err != nil {
-		return err
+		return nil, err
 	}
 
-	timestamp := getCurrentTime().Format(DT_FORMAT)
-	logLine := fmt.Sprintf("[%s] %s\n", timestamp, msg)
+	data, err := os.ReadFile(filePath)
+	if os.IsNotExist(err) {
+		return nil, errNoTimer
+	} else if err != nil {
+		return nil, err
+	}
 
-	f, err := os.OpenFile(filePath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
-	if err != nil {
-		return err
+	var header timerHeader
+	if err := json.Unmarshal(data, &header); err != nil {
+		return nil, err
 	}
-	defer f.Close()
+	return &header, nil
+}
+
+// debugLog is opened by the first logDebug call and reused for the rest of the run
+var debugLog *os.File
+
+func logDebug(msg string) error {
+	if debugLog == nil {
+		filePath, err := debugLogFilePath()
+		if err != nil {
+			return err
+		}
 
-	_, err = f.WriteString(logLine)
+		f, err := os.OpenFile(filePath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+		if err != nil {
+			return err
+		}
+		debugLog = f
+	}
+
+	timestamp := formatTime(getCurrentTime())
+	logLine := fmt.Sprintf("[%s] %s\n", timestamp, msg)
+
+	_, err := debugLog.WriteString(logLine)
 	return err
 }
 
+// closeDebugLog closes the debug-log handle, if open, so the next logDebug
+// call reopens the file
+func closeDebugLog() {
+	if debugLog != nil {
+		debugLog.Close()
+		debugLog = nil
+	}
+}
+
+// formatReportLine renders the one-line day summary shared by `wt report` and
+// the daily report file
+func formatReportLine(startDt, endDt time.Time, workMins, breakMins, pausedMins int) string {
+	// Check if crossed midnight
+	startYear, startMonth, startDay := startDt.Date()
+	endYear, endMonth, endDay := endDt.Date()
+	startDate := time.Date(startYear, startMonth, startDay, 0, 0, 0, 0, startDt.Location())
+	endDate := time.Date(endYear, endMonth, endDay, 0, 0, 0, 0, endDt.Location())
+	dayDiff := int(endDate.Sub(startDate).Hours() / 24)
+	dayIndicator := ""
+	if dayDiff > 0 {
+		dayIndicator = fmt.Sprintf(" [+%d day]", dayDiff)
+	}
+
+	return fmt.Sprintf("%s | %s -> %s | Work: %s | Break: %s | Paused: %s | Total: %s%s",
+		formatDate(startDt), formatClock(startDt), formatClock(endDt),
+		minutesToHourMinuteStr(workMins), minutesToHourMinuteStr(breakMins), minutesToHourMinuteStr(pausedMins),
+		minutesToHourMinuteStr(workMins+breakMins+pausedMins), dayIndicator)
+}
+
 func saveDailyReport(timer *Timer) error {
 	if timer.DayStart == "" {
 		return nil
 	}
 
-	// Calculate totals from timeline
-	totalWorkMins := 0
-	totalBreakMins := 0
-	totalPausedMins := 0
+	// Calculate totals from timeline; the current cycle starts where it ends
+	totals := timer.Totals()
+	totalWorkMins := totals.Work
+	totalBreakMins := totals.Break
+	totalPausedMins := totals.Paused
+	startDt := timer.DayStartTime()
+	cycleStart := startDt.Add(time.Duration(totals.Elapsed) * time.Minute)
 
-	for _, entry := range timer.Timeline {
-		if entry.Type == "work" {
-			totalWorkMins += entry.Minutes
-			totalPausedMins += entry.PausedMinutes
-		} else {
-			totalBreakMins += entry.Minutes
-		}
-	}
+	// End time includes work + paused time for running/paused cycles
+	endDt := cycleStart
 
 	// Add current running/paused time if applicable
-	currentMins := 0
-	currentPausedMins := 0
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
-		currentMins = calculateCurrentMinutes(timer)
+	if timer.IsActive() {
+		currentMins, currentPausedMins := calculateCurrentMinutes(timer, cycleStart)
 		totalWorkMins += currentMins
-
-		// Add current cycle's paused time
-		currentPausedMins = timer.PausedMinutes
-		if timer.Status == StatusPaused {
-			pauseStart, _ := parseTime(timer.PauseStartStr)
-			currentPausedMins += deltaMinutes(pauseStart, getCurrentTime())
-		}
 		totalPausedMins += currentPausedMins
-	}
-
-	// Calculate end time (includes work + paused time for running/paused cycles)
-	startDt, _ := parseTime(timer.DayStart)
-	endDt := timer.CurrentCycleStart()
 
-	// Add current running time (work minutes + paused minutes = elapsed time)
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
+		// Work minutes + paused minutes = elapsed time of the current cycle
 		endDt = endDt.Add(time.Duration(currentMins+currentPausedMins) * time.Minute)
 	}
 
-	// Format output
-	dateStr := startDt.Format("2006-01-02")
-	startTime := startDt.Format(TIME_ONLY_FORMAT)
-	endTime := endDt.Format(TIME_ONLY_FORMAT)
-	workStr := minutesToHourMinuteStr(totalWorkMins)
-	breakStr := minutesToHourMinuteStr(totalBreakMins)
-	pausedStr := minutesToHourMinuteStr(totalPausedMins)
-	totalStr := minutesToHourMinuteStr(totalWorkMins + totalBreakMins + totalPausedMins)
-
-	// Check if crossed midnight
-	dayDiff := int(endDt.Sub(startDt).Hours() / 24)
-	dayIndicator := ""
-	if dayDiff > 0 {
-		dayIndicator = fmt.Sprintf(" [+%d day]", dayDiff)
-	}
-
-	reportLine := fmt.Sprintf("%s | %s -> %s | Work: %s | Break: %s | Paused: %s | Total: %s%s",
-		dateStr, startTime, endTime, workStr, breakStr, pausedStr, totalStr, dayIndicator)
+	reportLine := formatReportLine(startDt, endDt, totalWorkMins, totalBreakMins, totalPausedMins)
 
 	// Prepend to daily report file (newest at top)
 	filePath, err := dailyReportFilePath()
@@ -675,12 +879,16 @@ func saveDailyReport(timer *Timer) error {
 // Command implementations
 
 func startCmd(timer *Timer, startTime string) error {
+	backdateMinutes := 0
 	if startTime != "" {
-		if err := validateTimeString(startTime); err != nil {
+		var err error
+		if backdateMinutes, err = parseTimeString(startTime); err != nil {
 			return err
 		}
 	}
 
+	now := getCurrentTime()
+
 	message := ""
 	switch timer.Status {
 	case StatusRunning:
@@ -689,8 +897,7 @@ func startCmd(timer *Timer, startTime string) error {
 	case StatusPaused:
 		message = "Resuming timer."
 		// Calculate pause duration and add to paused_minutes
-		pauseStart, _ := parseTime(timer.PauseStartStr)
-		pauseDuration := deltaMinutes(pauseStart, getCurrentTime())
+		pauseDuration := deltaMinutes(timer.PauseStartTime(), now)
 		timer.PausedMinutes += pauseDuration
 	case StatusStopped:
 		message = "Starting timer."
@@ -699,15 +906,16 @@ func startCmd(timer *Timer, startTime string) error {
 	// Track if this is first cycle (before adding break)
 	isFirstCycle := len(timer.Timeline) == 0
 
+	// A stop time means we're resuming from stopped state, with a break since then
+	hasBreak := timer.StopDatetimeStr != ""
+	breakMins := 0
+	if hasBreak {
+		breakMins = deltaMinutes(timer.StopTime(), now)
+	}
+
 	// If start_time is provided on subsequent cycle, validate break duration first
 	if startTime != "" && !isFirstCycle {
-		backdateMinutes, _ := stringTimeToMinutes(startTime)
-		// Calculate what the break would be
-		if timer.StopDatetimeStr != "" {
-			breakStart, _ := parseTime(timer.StopDatetimeStr)
-			breakStop := getCurrentTime()
-			breakMins := deltaMinutes(breakStart, breakStop)
-
+		if hasBreak {
 			if breakMins < backdateMinutes {
 				fmt.Printf("Cannot reduce break below 0. Break was %s, tried to subtract %s.\n",
 					minutesToHourMinuteStr(breakMins), minutesToHourMinuteStr(backdateMinutes))
@@ -720,19 +928,16 @@ func startCmd(timer *Timer, startTime string) error {
 		}
 	}
 
-	// Calculate break if resuming from stopped state
-	if timer.StopDatetimeStr != "" {
-		stopDt, _ := parseTime(timer.StopDatetimeStr)
-		breakMinutes := deltaMinutes(stopDt, getCurrentTime())
+	// Record the break since the last stop
+	if hasBreak {
 		timer.Timeline = append(timer.Timeline, TimelineEntry{
 			Type:    "break",
-			Minutes: breakMinutes,
+			Minutes: breakMins,
 		})
 	}
 
 	timer.StopDatetimeStr = ""
-	now := getCurrentTime()
-	timer.PauseStartStr = now.Format(DT_FORMAT)
+	timer.PauseStartStr = formatTime(now)
 
 	// If this is the first cycle of the day, set day_start
 	if timer.DayStart == "" {
@@ -741,6 +946,22 @@ func startCmd(timer *Timer, startTime string) error {
 
 	timer.Status = StatusRunning
 
+	// Handle start_time parameter before saving, so state is written once
+	if startTime != "" {
+		backdate := -time.Duration(backdateMinutes) * time.Minute
+
+		if isFirstCycle {
+			// Backdate the day_start
+			timer.DayStart = formatTime(timer.DayStartTime().Add(backdate))
+		} else {
+			// Reduce the last break duration to backdate cycle start
+			timer.LastEntry().Minutes -= backdateMinutes
+		}
+
+		// Also backdate pause_start_str
+		timer.PauseStartStr = formatTime(now.Add(backdate))
+	}
+
 	startTimeLog := ""
 	if startTime != "" {
 		startTimeLog = " " + startTime
@@ -754,36 +975,6 @@ func startCmd(timer *Timer, startTime string) error {
 	printMessageIfNotSilent(timer, message)
 	printCheckIfVerbose(timer)
 
-	// Handle start_time parameter
-	if startTime != "" {
-		backdateMinutes, _ := stringTimeToMinutes(startTime)
-
-		if isFirstCycle {
-			// Backdate the day_start and pause_start_str
-			dayStart, _ := parseTime(timer.DayStart)
-			timer.DayStart = dayStart.Add(-time.Duration(backdateMinutes) * time.Minute).Format(DT_FORMAT)
-
-			pauseStartDt, _ := parseTime(timer.PauseStartStr)
-			timer.PauseStartStr = pauseStartDt.Add(-time.Duration(backdateMinutes) * time.Minute).Format(DT_FORMAT)
-
-			if err := save(timer); err != nil {
-				return err
-			}
-		} else {
-			// Reduce the last break duration to backdate cycle start
-			lastIdx := len(timer.Timeline) - 1
-			timer.Timeline[lastIdx].Minutes -= backdateMinutes
-
-			// Also backdate pause_start_str
-			pauseStartDt, _ := parseTime(timer.PauseStartStr)
-			timer.PauseStartStr = pauseStartDt.Add(-time.Duration(backdateMinutes) * time.Minute).Format(DT_FORMAT)
-
-			if err := save(timer); err != nil {
-				return err
-			}
-		}
-	}
-
 	return nil
 }
 
@@ -794,12 +985,12 @@ func stopCmd(timer *Timer) error {
 		return nil
 	case StatusRunning, StatusPaused:
 		now := getCurrentTime()
-		stopTimeStr := now.Format(DT_FORMAT)
+		stopTimeStr := formatTime(now)
 
 		// Calculate work duration: total_cycle_time - paused_time
 		totalPaused := timer.PausedMinutes
 		if timer.Status == StatusPaused {
-			pauseStart, _ := parseTime(timer.PauseStartStr)
+			pauseStart := timer.PauseStartTime()
 			currentPause := deltaMinutes(pauseStart, now)
 			totalPaused += currentPause
 		}
@@ -816,15 +1007,10 @@ func stopCmd(timer *Timer) error {
 		}
 
 		// If last entry is work (no break between), merge into it
-		mergedIntoExisting := false
-		if len(timer.Timeline) > 0 && timer.Timeline[len(timer.Timeline)-1].Type == "work" {
-			lastWork := &timer.Timeline[len(timer.Timeline)-1]
-			lastWork.Minutes += cycleMinutes
-			lastWork.PausedMinutes += totalPaused
-			mergedIntoExisting = true
-		}
-
-		if !mergedIntoExisting {
+		if last := timer.LastEntry(); last != nil && last.Type == "work" {
+			last.Minutes += cycleMinutes
+			last.PausedMinutes += totalPaused
+		} else {
 			timer.Timeline = append(timer.Timeline, TimelineEntry{
 				Type:          "work",
 				Minutes:       cycleMinutes,
@@ -863,11 +1049,8 @@ func pauseCmd(timer *Timer, pauseTime string) error {
 		// Validate and handle optional pause time parameter
 		additionalPause := 0
 		if pauseTime != "" {
-			if err := validateTimeString(pauseTime); err != nil {
-				return err
-			}
 			var err error
-			additionalPause, err = stringTimeToMinutes(pauseTime)
+			additionalPause, err = parseTimeString(pauseTime)
 			if err != nil {
 				return err
 			}
@@ -886,9 +1069,9 @@ func pauseCmd(timer *Timer, pauseTime string) error {
 		// Set pause start time (backdated if additional pause time provided)
 		now := getCurrentTime()
 		if additionalPause > 0 {
-			timer.PauseStartStr = now.Add(-time.Duration(additionalPause) * time.Minute).Format(DT_FORMAT)
+			timer.PauseStartStr = formatTime(now.Add(-time.Duration(additionalPause) * time.Minute))
 		} else {
-			timer.PauseStartStr = now.Format(DT_FORMAT)
+			timer.PauseStartStr = formatTime(now)
 		}
 		timer.Status = StatusPaused
 
@@ -920,18 +1103,15 @@ func checkCmd(timer *Timer) error {
 	runningMinutes := 0
 	pausedMinutes := 0
 
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
-		runningMinutes = calculateCurrentMinutes(timer)
-		pausedMinutes = timer.PausedMinutes
+	// One pass gives both the completed work and where the current cycle starts
+	totals := timer.Totals()
 
-		if timer.Status == StatusPaused {
-			pauseStart, _ := parseTime(timer.PauseStartStr)
-			currentPause := deltaMinutes(pauseStart, getCurrentTime())
-			pausedMinutes += currentPause
-		}
+	if timer.IsActive() {
+		cycleStart := timer.DayStartTime().Add(time.Duration(totals.Elapsed) * time.Minute)
+		runningMinutes, pausedMinutes = calculateCurrentMinutes(timer, cycleStart)
 	}
 
-	totalMinutes := runningMinutes + timer.CompletedMinutes()
+	totalMinutes := runningMinutes + totals.Work
 
 	var runningStr string
 	switch timer.Status {
@@ -957,19 +1137,11 @@ func checkCmd(timer *Timer) error {
 }
 
 func historyCmd(timer *Timer, logType string) error {
-	validTypes := []string{"info", "debug"}
-	if logType != "" {
-		valid := false
-		for _, t := range validTypes {
-			if t == logType {
-				valid = true
-				break
-			}
-		}
-		if !valid {
-			fmt.Printf("Invalid log type: %s. Use one of: ['info', 'debug']\n", logType)
-			return nil
-		}
+	switch logType {
+	case "", "info", "debug":
+	default:
+		fmt.Printf("Invalid log type: %s. Use one of: ['info', 'debug']\n", logType)
+		return nil
 	}
 
 	// Debug log still reads from file
@@ -978,12 +1150,16 @@ func historyCmd(timer *Timer, logType string) error {
 		if err != nil {
 			return err
 		}
-		data, err := os.ReadFile(filePath)
-		if err != nil {
+		f, err := os.Open(filePath)
+		if os.IsNotExist(err) {
+			// Created on the first logged command, so nothing logged yet
+			return nil
+		} else if err != nil {
 			return err
 		}
-		fmt.Print(string(data))
-		return nil
+		defer f.Close()
+		_, err = io.Copy(os.Stdout, f)
+		return err
 	}
 
 	// Generate info-log on-the-fly from timeline
@@ -992,29 +1168,36 @@ func historyCmd(timer *Timer, logType string) error {
 		return nil
 	}
 
-	// Generate entries from timeline
-	var currentTime time.Time
+	// os.Stdout is unbuffered, so collect the log and write it in one go
+	out := bufio.NewWriter(os.Stdout)
+
+	// Generate entries from timeline. Entry times are base + minutes elapsed
+	// before the entry, so only an int is carried between iterations.
+	var base time.Time
 	if timer.DayStart != "" {
-		currentTime, _ = parseTime(timer.DayStart)
+		base = timer.DayStartTime()
 	} else {
-		currentTime = getCurrentTime()
+		base = getCurrentTime()
 	}
 
+	elapsed := 0
 	runningTotal := 0
 	lineNum := 1
 
 	for _, entry := range timer.Timeline {
+		startTime := base.Add(time.Duration(elapsed) * time.Minute)
+		elapsed += entry.Duration()
+		endTime := base.Add(time.Duration(elapsed) * time.Minute)
+
+		startTimeStr := formatClock(startTime)
+		endTimeStr := formatClock(endTime)
+
 		if entry.Type == "work" {
 			workMins := entry.Minutes
 			pausedMins := entry.PausedMinutes
 
-			startTime := currentTime
-			endTime := currentTime.Add(time.Duration(entry.Duration()) * time.Minute)
-
 			runningTotal += workMins
 
-			startTimeStr := startTime.Format(TIME_ONLY_FORMAT)
-			endTimeStr := endTime.Format(TIME_ONLY_FORMAT)
 			workStr := minutesToHourMinuteStr(workMins)
 			totalStr := minutesToHourMinuteStr(runningTotal)
 
@@ -1024,48 +1207,40 @@ func historyCmd(timer *Timer, logType string) error {
 			}
 
 			// Calculate day indicator for midnight crossing
-			dayDiff := int(endTime.Sub(startTime.Truncate(24*time.Hour)).Hours()/24) - int(startTime.Sub(startTime.Truncate(24*time.Hour)).Hours()/24)
 			startYear, startMonth, startDay := startTime.Date()
 			endYear, endMonth, endDay := endTime.Date()
 			startDate := time.Date(startYear, startMonth, startDay, 0, 0, 0, 0, startTime.Location())
 			endDate := time.Date(endYear, endMonth, endDay, 0, 0, 0, 0, endTime.Location())
-			dayDiff = int(endDate.Sub(startDate).Hours() / 24)
+			dayDiff := int(endDate.Sub(startDate).Hours() / 24)
 			dayIndicator := ""
 			if dayDiff > 0 {
 				dayIndicator = fmt.Sprintf("  [+%d day]", dayDiff)
 			}
 
-			fmt.Printf("%02d. [%s => %s] Work: %s%s (%s)%s\n",
+			fmt.Fprintf(out, "%02d. [%s => %s] Work: %s%s (%s)%s\n",
 				lineNum, startTimeStr, endTimeStr, workStr, pausedStr, totalStr, dayIndicator)
-
-			currentTime = endTime
 		} else {
-			breakMins := entry.Minutes
-			endTime := currentTime.Add(time.Duration(breakMins) * time.Minute)
-
-			startTimeStr := currentTime.Format(TIME_ONLY_FORMAT)
-			endTimeStr := endTime.Format(TIME_ONLY_FORMAT)
-			breakStr := minutesToHourMinuteStr(breakMins)
+			breakStr := minutesToHourMinuteStr(entry.Minutes)
 
-			fmt.Printf("%02d. [%s => %s] Break: %s\n",
+			fmt.Fprintf(out, "%02d. [%s => %s] Break: %s\n",
 				lineNum, startTimeStr, endTimeStr, breakStr)
-
-			currentTime = endTime
 		}
 
 		lineNum++
 	}
 
+	currentTime := base.Add(time.Duration(elapsed) * time.Minute)
+
 	// If timer is running or paused, show current active cycle
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
-		currentMinutes := calculateCurrentMinutes(timer)
+	if timer.IsActive() {
+		currentMinutes, totalPaused := calculateCurrentMinutes(timer, currentTime)
 		totalMinutes := currentMinutes + runningTotal
 
 		currentStr := minutesToHourMinuteStr(currentMinutes)
 		totalStr := minutesToHourMinuteStr(totalMinutes)
 
 		// Use calculated start time from timeline
-		startTimeOnly := currentTime.Format(TIME_ONLY_FORMAT)
+		startTimeOnly := formatClock(currentTime)
 
 		now := getCurrentTime()
 		dayDiff := int(now.Sub(currentTime).Hours() / 24)
@@ -1074,14 +1249,6 @@ func historyCmd(timer *Timer, logType string) error {
 			dayIndicator = fmt.Sprintf("  [+%d day]", dayDiff)
 		}
 
-		// Calculate paused minutes for current cycle
-		totalPaused := timer.PausedMinutes
-		if timer.Status == StatusPaused {
-			pauseStart, _ := parseTime(timer.PauseStartStr)
-			currentPause := deltaMinutes(pauseStart, now)
-			totalPaused += currentPause
-		}
-
 		pausedStr := ""
 		if totalPaused > 0 {
 			pausedStr = fmt.Sprintf(" |%02dm|", totalPaused)
@@ -1092,11 +1259,11 @@ func historyCmd(timer *Timer, logType string) error {
 			statusSuffix = " (paused)"
 		}
 
-		fmt.Printf("%02d. [%s => .....] Work%s: %s%s (%s)%s\n",
+		fmt.Fprintf(out, "%02d. [%s => .....] Work%s: %s%s (%s)%s\n",
 			lineNum, startTimeOnly, statusSuffix, currentStr, pausedStr, totalStr, dayIndicator)
 	}
 
-	return nil
+	return out.Flush()
 }
 
 func reportCmd(timer *Timer) error {
@@ -1106,76 +1273,40 @@ func reportCmd(timer *Timer) error {
 	}
 
 	// Calculate totals from timeline
-	totalWorkMins := 0
-	totalBreakMins := 0
-	totalPausedMins := 0
+	totals := timer.Totals()
+	totalWorkMins := totals.Work
+	totalBreakMins := totals.Break
+	totalPausedMins := totals.Paused
 
-	for _, entry := range timer.Timeline {
-		if entry.Type == "work" {
-			totalWorkMins += entry.Minutes
-			totalPausedMins += entry.PausedMinutes
-		} else {
-			totalBreakMins += entry.Minutes
-		}
-	}
+	// End time starts at the current cycle start, running time is added below
+	startDt := timer.DayStartTime()
+	endDt := startDt.Add(time.Duration(totals.Elapsed) * time.Minute)
 
 	// Add current running/paused time if applicable
-	currentMins := 0
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
-		currentMins = calculateCurrentMinutes(timer)
+	if timer.IsActive() {
+		currentMins, currentPausedMins := calculateCurrentMinutes(timer, endDt)
 		totalWorkMins += currentMins
+		totalPausedMins += currentPausedMins
 
-		// Add current cycle's paused time
-		if timer.Status == StatusPaused {
-			pauseStart, _ := parseTime(timer.PauseStartStr)
-			currentPause := deltaMinutes(pauseStart, getCurrentTime())
-			totalPausedMins += timer.PausedMinutes + currentPause
-		} else {
-			totalPausedMins += timer.PausedMinutes
-		}
-	}
-
-	// Calculate end time
-	startDt, _ := parseTime(timer.DayStart)
-	endDt := timer.CurrentCycleStart()
-
-	// Add current running time
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
+		// Add current running time
 		endDt = endDt.Add(time.Duration(currentMins) * time.Minute)
 	}
 
-	// Format output
-	dateStr := startDt.Format("2006-01-02")
-	startTime := startDt.Format(TIME_ONLY_FORMAT)
-	endTime := endDt.Format(TIME_ONLY_FORMAT)
-	workStr := minutesToHourMinuteStr(totalWorkMins)
-	breakStr := minutesToHourMinuteStr(totalBreakMins)
-	pausedStr := minutesToHourMinuteStr(totalPausedMins)
-	totalStr := minutesToHourMinuteStr(totalWorkMins + totalBreakMins + totalPausedMins)
-
-	// Check if crossed midnight
-	startYear, startMonth, startDay := startDt.Date()
-	endYear, endMonth, endDay := endDt.Date()
-	startDate := time.Date(startYear, startMonth, startDay, 0, 0, 0, 0, startDt.Location())
-	endDate := time.Date(endYear, endMonth, endDay, 0, 0, 0, 0, endDt.Location())
-	dayDiff := int(endDate.Sub(startDate).Hours() / 24)
-	dayIndicator := ""
-	if dayDiff > 0 {
-		dayIndicator = fmt.Sprintf(" [+%d day]", dayDiff)
-	}
-
-	fmt.Printf("%s | %s -> %s | Work: %s | Break: %s | Paused: %s | Total: %s%s\n",
-		dateStr, startTime, endTime, workStr, breakStr, pausedStr, totalStr, dayIndicator)
+	fmt.Println(formatReportLine(startDt, endDt, totalWorkMins, totalBreakMins, totalPausedMins))
 
 	return nil
 }
 
+// modUsage is printed by `wt mod` without arguments
+const modUsage = `Usage:
+  wt mod start <add|sub> <time>       - adjust day start time
+  wt mod <num> <add|sub> <time>       - adjust cycle duration
+  wt mod <num> pause <add|sub> <time> - adjust paused time
+  wt mod <num> drop                   - remove cycle
+`
+
 func modListCmd() error {
-	fmt.Println("Usage:")
-	fmt.Println("  wt mod start <add|sub> <time>       - adjust day start time")
-	fmt.Println("  wt mod <num> <add|sub> <time>       - adjust cycle duration")
-	fmt.Println("  wt mod <num> pause <add|sub> <time> - adjust paused time")
-	fmt.Println("  wt mod <num> drop                   - remove cycle")
+	fmt.Print(modUsage)
 	return nil
 }
 
@@ -1198,7 +1329,7 @@ func modStartCmd(timer *Timer, operation, timeStr string) error {
 		return err
 	}
 
-	dayStart, _ := parseTime(timer.DayStart)
+	dayStart := timer.DayStartTime()
 	var newDayStart time.Time
 	if operation == "sub" {
 		newDayStart = dayStart.Add(-time.Duration(minutes) * time.Minute)
@@ -1206,20 +1337,12 @@ func modStartCmd(timer *Timer, operation, timeStr string) error {
 		newDayStart = dayStart.Add(time.Duration(minutes) * time.Minute)
 	}
 
-	timer.DayStart = newDayStart.Format(DT_FORMAT)
+	timer.DayStart = formatTime(newDayStart)
 
 	// If currently running the first work cycle, also adjust PauseStartStr
-	if (timer.Status == StatusRunning || timer.Status == StatusPaused) && timer.PauseStartStr != "" {
-		hasWorkCycles := false
-		for _, entry := range timer.Timeline {
-			if entry.Type == "work" {
-				hasWorkCycles = true
-				break
-			}
-		}
-
-		if !hasWorkCycles {
-			pauseStartDt, _ := parseTime(timer.PauseStartStr)
+	if timer.IsActive() && timer.PauseStartStr != "" {
+		if !timer.HasWorkCycles() {
+			pauseStartDt := timer.PauseStartTime()
 
 			var newPauseStart time.Time
 			if operation == "sub" {
@@ -1228,7 +1351,7 @@ func modStartCmd(timer *Timer, operation, timeStr string) error {
 				newPauseStart = pauseStartDt.Add(time.Duration(minutes) * time.Minute)
 			}
 
-			timer.PauseStartStr = newPauseStart.Format(DT_FORMAT)
+			timer.PauseStartStr = formatTime(newPauseStart)
 		}
 	}
 
@@ -1255,7 +1378,7 @@ func modDurationCmd(timer *Timer, cycleNumStr, operation, timeStr string) error
 	cycleNum, _ := strconv.Atoi(cycleNumStr)
 
 	// Check if user is trying to modify current running/paused cycle
-	if (timer.Status == StatusRunning || timer.Status == StatusPaused) && cycleNum == len(timer.Timeline)+1 {
+	if timer.IsActive() && cycleNum == len(timer.Timeline)+1 {
 		fmt.Println("Cannot modify duration of current running cycle.")
 		fmt.Println("To adjust when this cycle started, modify the previous cycle or break duration.")
 		fmt.Printf("To adjust paused time: wt mod %d pause <add|sub> <time>\n", cycleNum)
@@ -1319,7 +1442,7 @@ func modPauseCmd(timer *Timer, cycleNumStr, operation, timeStr string) error {
 
 	cycleNum, _ := strconv.Atoi(cycleNumStr)
 
-	isCurrentCycle := (timer.Status == StatusRunning || timer.Status == StatusPaused) &&
+	isCurrentCycle := timer.IsActive() &&
 		cycleNum == len(timer.Timeline)+1
 
 	if isCurrentCycle && timer.Status == StatusPaused {
@@ -1329,7 +1452,7 @@ func modPauseCmd(timer *Timer, cycleNumStr, operation, timeStr string) error {
 	}
 
 	maxCycle := len(timer.Timeline)
-	if timer.Status == StatusRunning || timer.Status == StatusPaused {
+	if timer.IsActive() {
 		maxCycle++
 	}
 
@@ -1428,28 +1551,35 @@ func modDropCmd(timer *Timer, cycleNumStr string) error {
 	}
 
 	entryIdx := cycleNum - 1
-	entry := timer.Timeline[entryIdx]
-	entryType := entry.Type
+	entry := &timer.Timeline[entryIdx]
+
+	// Neighbours of the dropped entry, nil at either end of the timeline
+	var prev, next *TimelineEntry
+	if entryIdx > 0 {
+		prev = &timer.Timeline[entryIdx-1]
+	}
+	if entryIdx < len(timer.Timeline)-1 {
+		next = &timer.Timeline[entryIdx+1]
+	}
 
 	mergeMsg := ""
 
-	if entryType == "break" {
-		hasPrevWork := entryIdx > 0 && timer.Timeline[entryIdx-1].Type == "work"
-		hasNextWork := entryIdx < len(timer.Timeline)-1 && timer.Timeline[entryIdx+1].Type == "work"
+	if entry.Type == "break" {
+		hasPrevWork := prev != nil && prev.Type == "work"
+		hasNextWork := next != nil && next.Type == "work"
 
-		isCurrentlyActive := timer.Status == StatusRunning || timer.Status == StatusPaused
-		isLastBreak := entryIdx == len(timer.Timeline)-1
+		isCurrentlyActive := timer.IsActive()
+		isLastBreak := next == nil
 
 		if hasPrevWork && isCurrentlyActive && isLastBreak {
-			prevWork := timer.Timeline[entryIdx-1]
-
 			// Calculate when the original work session started (before the previous work entry)
-			originalStart, _ := parseTime(timer.DayStart)
+			elapsedBefore := 0
 			for i := 0; i < entryIdx-1; i++ {
-				originalStart = originalStart.Add(time.Duration(timer.Timeline[i].Duration()) * time.Minute)
+				elapsedBefore += timer.Timeline[i].Duration()
 			}
+			originalStart := timer.DayStartTime().Add(time.Duration(elapsedBefore) * time.Minute)
 
-			combinedPaused := prevWork.PausedMinutes + timer.PausedMinutes
+			combinedPaused := prev.PausedMinutes + timer.PausedMinutes
 
 			// Remove the break and the previous work entry
 			timer.Timeline = append(timer.Timeline[:entryIdx-1], timer.Timeline[entryIdx+1:]...)
@@ -1461,7 +1591,7 @@ func modDropCmd(timer *Timer, cycleNumStr string) error {
 			totalCycleTime := deltaMinutes(originalStart, now)
 			totalPausedCalc := combinedPaused
 			if timer.Status == StatusPaused {
-				pauseStart, _ := parseTime(timer.PauseStartStr)
+				pauseStart := timer.PauseStartTime()
 				currentPause := deltaMinutes(pauseStart, now)
 				totalPausedCalc += currentPause
 			}
@@ -1469,16 +1599,12 @@ func modDropCmd(timer *Timer, cycleNumStr string) error {
 
 			mergeMsg = fmt.Sprintf(" (merged with running cycle: %s)", minutesToHourMinuteStr(totalWork))
 		} else if hasPrevWork && hasNextWork {
-			prevWork := &timer.Timeline[entryIdx-1]
-			breakMins := timer.Timeline[entryIdx].Minutes
-			nextWork := timer.Timeline[entryIdx+1]
-
 			// Merge work cycles: break was actually work time, so add it to work minutes
-			mergedWorkMins := prevWork.Minutes + breakMins + nextWork.Minutes
-			mergedPausedMins := prevWork.PausedMinutes + nextWork.PausedMinutes
+			mergedWorkMins := prev.Minutes + entry.Minutes + next.Minutes
+			mergedPausedMins := prev.PausedMinutes + next.PausedMinutes
 
-			prevWork.Minutes = mergedWorkMins
-			prevWork.PausedMinutes = mergedPausedMins
+			prev.Minutes = mergedWorkMins
+			prev.PausedMinutes = mergedPausedMins
 
 			// Remove the break and next work
 			timer.Timeline = append(timer.Timeline[:entryIdx], timer.Timeline[entryIdx+2:]...)
@@ -1487,16 +1613,14 @@ func modDropCmd(timer *Timer, cycleNumStr string) error {
 			timer.Timeline = append(timer.Timeline[:entryIdx], timer.Timeline[entryIdx+1:]...)
 		}
 	} else { // work cycle
-		hasPrevBreak := entryIdx > 0 && timer.Timeline[entryIdx-1].Type == "break"
-		hasNextBreak := entryIdx < len(timer.Timeline)-1 && timer.Timeline[entryIdx+1].Type == "break"
+		hasPrevBreak := prev != nil && prev.Type == "break"
+		hasNextBreak := next != nil && next.Type == "break"
 
 		if hasPrevBreak && hasNextBreak {
-			prevBreakMins := timer.Timeline[entryIdx-1].Minutes
-			workMins := timer.Timeline[entryIdx].ElapsedMinutes() // Work time becomes break (wasn't actually working)
-			nextBreakMins := timer.Timeline[entryIdx+1].Minutes
-			mergedMins := prevBreakMins + workMins + nextBreakMins
+			workMins := entry.ElapsedMinutes() // Work time becomes break (wasn't actually working)
+			mergedMins := prev.Minutes + workMins + next.Minutes
 
-			timer.Timeline[entryIdx-1].Minutes = mergedMins
+			prev.Minutes = mergedMins
 			timer.Timeline = append(timer.Timeline[:entryIdx], timer.Timeline[entryIdx+2:]...)
 			mergeMsg = fmt.Sprintf(" (merged adjacent breaks: %s)", minutesToHourMinuteStr(mergedMins))
 		} else {
@@ -1515,29 +1639,19 @@ func modDropCmd(timer *Timer, cycleNumStr string) error {
 }
 
 func nextCmd(timer *Timer) error {
+	// stopCmd updates timer in place, so carry on from it without reloading
 	if err := stopCmd(timer); err != nil {
 		return err
 	}
 
-	// Reload timer after stop
-	var err error
-	timer, err = load()
-	if err != nil {
-		return err
-	}
-
 	timer.Timeline = append(timer.Timeline, TimelineEntry{
 		Type:    "break",
 		Minutes: 0,
 	})
 
-	if err := save(timer); err != nil {
-		return err
-	}
-
 	timer.StopDatetimeStr = ""
 	now := getCurrentTime()
-	timer.PauseStartStr = now.Format(DT_FORMAT)
+	timer.PauseStartStr = formatTime(now)
 	timer.PausedMinutes = 0
 	timer.Status = StatusRunning
 
@@ -1553,50 +1667,132 @@ func nextCmd(timer *Timer) error {
 }
 
 func resetCmd(msg string) error {
-	var oldMode string
-	var dailyReportContent []byte
+	_, err := resetTimer(msg)
+	return err
+}
 
-	filePath, err := outputFilePath()
+// isInsideFolder reports whether path lies within folder, however either of
+// them is spelled (relative, absolute, or with redundant elements)
+func isInsideFolder(path, folder string) bool {
+	absPath, err := filepath.Abs(path)
+	if err != nil {
+		return false
+	}
+	absFolder, err := filepath.Abs(folder)
+	if err != nil {
+		return false
+	}
+	rel, err := filepath.Rel(absFolder, absPath)
+	if err != nil {
+		return false
+	}
+	return rel != "." && rel != ".." && !strings.HasPrefix(rel, ".."+string(filepath.Separator))
+}
+
+// mergeParkedReport folds a report left next to the output folder by an
+// interrupted reset back into reportPath, keeping newer lines on top and
+// dropping lines present in both, then removes the parked file
+func mergeParkedReport(parkedPath, reportPath string) error {
+	parked, err := os.ReadFile(parkedPath)
 	if err != nil {
 		return err
 	}
+	current, _ := os.ReadFile(reportPath)
 
-	if _, err := os.Stat(filePath); err == nil {
-		oldTimer, err := load()
-		if err != nil {
+	seen := make(map[string]bool)
+	var lines []string
+	for _, line := range strings.Split(string(current)+"\n"+string(parked), "\n") {
+		if line == "" || seen[line] {
+			continue
+		}
+		seen[line] = true
+		lines = append(lines, line)
+	}
+
+	if len(lines) > 0 {
+		os.MkdirAll(filepath.Dir(reportPath), 0755)
+		if err := os.WriteFile(reportPath, []byte(strings.Join(lines, "\n")+"\n"), 0644); err != nil {
 			return err
 		}
+	}
+	return os.Remove(parkedPath)
+}
+
+// resetTimer replaces the saved timer with a fresh one, keeping the mode and
+// daily report, and returns the new timer
+func resetTimer(msg string) (*Timer, error) {
+	var oldMode string
+
+	outputFolder, err := outputFolderPath()
+	if err != nil {
+		return nil, err
+	}
 
+	// The daily report survives the reset. When it lives in the output folder
+	// it is moved out of the way while the folder is recreated.
+	dailyReportPath, _ := dailyReportFilePath()
+	keepPath := ""
+	var keepContent []byte
+
+	oldTimer, err := load()
+	if err != nil && !errors.Is(err, errNoTimer) {
+		return nil, err
+	}
+
+	if oldTimer != nil {
 		if !yesOrNoPrompt("Reset timer?") {
-			os.Exit(0)
+			return nil, errAborted
 		}
 
 		oldMode = oldTimer.Mode
 		saveDailyReport(oldTimer)
+	}
+
+	if isInsideFolder(dailyReportPath, outputFolder) {
+		keepPath = outputFolder + "-" + DailyReportName
 
-		dailyReportPath, _ := dailyReportFilePath()
-		if data, err := os.ReadFile(dailyReportPath); err == nil {
-			dailyReportContent = data
+		// A report parked by an interrupted reset holds the earlier days, so
+		// merge it in rather than moving the current report over it
+		if _, err := os.Stat(keepPath); err == nil {
+			if err := mergeParkedReport(keepPath, dailyReportPath); err != nil {
+				keepPath = ""
+			}
 		}
-	}
 
-	outputFolder, err := outputFolderPath()
-	if err != nil {
-		return err
-	}
+		if keepPath != "" {
+			if err := os.Rename(dailyReportPath, keepPath); err != nil {
+				keepPath = ""
+			}
+		}
 
-	if _, err := os.Stat(outputFolder); err == nil {
-		os.RemoveAll(outputFolder)
+		// Fall back to holding the report in memory
+		if keepPath == "" {
+			keepContent, _ = os.ReadFile(dailyReportPath)
+		}
 	}
 
+	closeDebugLog()
+	os.RemoveAll(outputFolder)
+
 	os.MkdirAll(outputFolder, 0755)
 
-	debugPath, _ := debugLogFilePath()
-	os.Create(debugPath)
+	if keepPath != "" || keepContent != nil {
+		os.MkdirAll(filepath.Dir(dailyReportPath), 0755)
+	}
+
+	if keepPath != "" {
+		if err := os.Rename(keepPath, dailyReportPath); err != nil {
+			// Fall back to copying the report back and dropping the moved file
+			if data, err := os.ReadFile(keepPath); err == nil {
+				if err := os.WriteFile(dailyReportPath, data, 0644); err == nil {
+					os.Remove(keepPath)
+				}
+			}
+		}
+	}
 
-	if dailyReportContent != nil {
-		dailyPath, _ := dailyReportFilePath()
-		os.WriteFile(dailyPath, dailyReportContent, 0644)
+	if keepContent != nil {
+		os.WriteFile(dailyReportPath, keepContent, 0644)
 	}
 
 	timer := &Timer{
@@ -1614,13 +1810,13 @@ func resetCmd(msg string) error {
 	}
 
 	if err := save(timer); err != nil {
-		return err
+		return nil, err
 	}
 
 	printMessageIfNotSilent(timer, msg)
 	printCheckIfVerbose(timer)
 
-	return nil
+	return timer, nil
 }
 
 func restartCmd(startTime string) error {
@@ -1630,11 +1826,7 @@ func restartCmd(startTime string) error {
 		}
 	}
 
-	if err := resetCmd("Timer reset."); err != nil {
-		return err
-	}
-
-	timer, err := load()
+	timer, err := resetTimer("Timer reset.")
 	if err != nil {
 		return err
 	}
@@ -1653,7 +1845,7 @@ func removeCmd() error {
 	}
 
 	if !yesOrNoPrompt("Remove timer?") {
-		os.Exit(0)
+		return errAborted
 	}
 
 	// Save daily report before removing timer
@@ -1666,9 +1858,7 @@ func removeCmd() error {
 	os.Remove(debugPath)
 
 	dailyPath, _ := dailyReportFilePath()
-	if _, err := os.Stat(dailyPath); err == nil {
-		os.Remove(dailyPath)
-	}
+	os.Remove(dailyPath)
 
 	printMessageIfNotSilent(timer, "Timer removed.")
 
@@ -1676,22 +1866,15 @@ func removeCmd() error {
 }
 
 func statusCmd() error {
-	filePath, err := outputFilePath()
-	if err != nil {
-		return err
-	}
-
-	if _, err := os.Stat(filePath); os.IsNotExist(err) {
+	header, err := loadHeader()
+	if errors.Is(err, errNoTimer) {
 		fmt.Println(StatusStopped)
 		return nil
-	}
-
-	timer, err := load()
-	if err != nil {
+	} else if err != nil {
 		return err
 	}
 
-	fmt.Println(timer.Status)
+	fmt.Println(header.Status)
 	return nil
 }
 
@@ -1724,17 +1907,16 @@ func debugCmd() error {
 
 	fmt.Printf("output_file_path() = %s\nDT_FORMAT = %s\n", filePath, DT_FORMAT)
 
-	if _, err := os.Stat(filePath); err == nil {
-		timer, err := load()
-		if err != nil {
-			return err
-		}
-
-		data, _ := json.MarshalIndent(timer, "", "    ")
-		fmt.Println(string(data))
-	} else {
+	timer, err := load()
+	if errors.Is(err, errNoTimer) {
 		fmt.Printf("No file at %s\n", filePath)
+		return nil
+	} else if err != nil {
+		return err
 	}
 
+	data, _ := json.MarshalIndent(timer, "", "    ")
+	fmt.Println(string(data))
+
 	return nil
 }